@@ -1,7 +1,7 @@
 import polars as pl
 
 from analyzer_interface.context import PrimaryAnalyzerContext
-from services.tokenizer.basic import TokenizerConfig, tokenize_text
+from services.tokenizer.basic import TokenizerConfig, create_basic_tokenizer
 from services.tokenizer.core.types import CaseHandling
 from terminal_tools import ProgressReporter
 
@@ -70,12 +70,15 @@ def _extract_ngrams_from_messages(
         - ngrams_by_id: Dict mapping serialized n-gram strings to n-gram IDs
     """
 
+    # One tokenizer for all messages instead of one per row
+    tokenizer = create_basic_tokenizer(tokenizer_config)
+
     def get_ngram_rows(ngrams_by_id: dict[str, int]):
         num_rows = df_input.height
         current_row = 0
 
         for row in df_input.iter_rows(named=True):
-            tokens = tokenize_text(row[COL_MESSAGE_TEXT], tokenizer_config)
+            tokens = tokenizer.tokenize(row[COL_MESSAGE_TEXT])
 
             # this will track within message repetitions
             seen_ngrams_in_message = set()
@@ -1,4 +1,5 @@
 import csv
+import re
 from csv import Sniffer
 from typing import Callable, Optional
 
@@ -10,6 +11,33 @@ from terminal_tools.utils import print_message, smart_print_data_frame
 
 from .importer import Importer, ImporterSession
 
+# Upper bound on how much of the file is inspected to detect notes and dialect
+SNIFF_LIMIT = 65536
+MAX_SNIFF_LINES = 50
+
+# Words commonly found in column names, matched anywhere in a field
+HEADER_WORD_PATTERN = re.compile(
+    "|".join(
+        [
+            "id",
+            "name",
+            "date",
+            "time",
+            "user",
+            "tweet",
+            "text",
+            "count",
+            "number",
+            "sent",
+            "screen",
+            "retweeted",
+            "favorited",
+        ]
+    )
+)
+# Prefixes of note lines that are never column names
+NOTE_PREFIXES = ("http", "www", "from ", "if you")
+
 
 class CSVImporter(Importer["CsvImportSession"]):
     @property
@@ -22,70 +50,72 @@ class CSVImporter(Importer["CsvImportSession"]):
     def _detect_skip_rows_and_dialect(self, input_path: str) -> tuple[int, csv.Dialect]:
         """Detect the number of rows to skip before CSV data begins and the CSV dialect."""
         skip_rows = 0
+        buffer = None
 
         try:
-            with open(input_path, "r", encoding="utf8") as file:
-
-                MAX_LINES = 50  # check the first 50 lines only
-                lines = [line.strip() for i, line in enumerate(file) if i <= MAX_LINES]
-                total_lines = len(lines)
-
-                # Only analyze if we have enough lines
-                if len(lines) >= 2:
-                    # Parse each line and analyze content, keeping track of original line numbers
-                    parsed_rows = []
-                    line_numbers = []
-                    for line_idx, line in enumerate(lines):
-                        if not line:  # Skip empty lines
-                            continue
-                        try:
-                            reader = csv.reader([line])
-                            row = next(reader)
-                            parsed_rows.append(row)
-                            line_numbers.append(line_idx)
-                        except Exception:
-                            parsed_rows.append([line])  # Fallback for problematic lines
-                            line_numbers.append(line_idx)
-
-                    if len(parsed_rows) >= 2:
-                        # Look for the actual CSV header (column names)
-                        for i, row in enumerate(parsed_rows):
-                            if self._looks_like_csv_header(row):
+            buffer = self._read_sniff_buffer(input_path)
+
+            lines = buffer.split("\n")
+            if len(buffer) >= SNIFF_LIMIT or not lines[-1]:
+                # Drop the truncated (or empty) last line of the buffer
+                lines.pop()
+
+            # check the first MAX_SNIFF_LINES lines only
+            lines = [line.strip() for line in lines[: MAX_SNIFF_LINES + 1]]
+            total_lines = len(lines)
+
+            # Only analyze if we have enough lines
+            if len(lines) >= 2:
+                # Parse each line and analyze content, keeping track of original line numbers
+                parsed_rows = []
+                line_numbers = []
+                for line_idx, line in enumerate(lines):
+                    if not line:  # Skip empty lines
+                        continue
+                    try:
+                        reader = csv.reader([line])
+                        row = next(reader)
+                        parsed_rows.append(row)
+                        line_numbers.append(line_idx)
+                    except Exception:
+                        parsed_rows.append([line])  # Fallback for problematic lines
+                        line_numbers.append(line_idx)
+
+                if len(parsed_rows) >= 2:
+                    # Look for the actual CSV header (column names)
+                    for i, row in enumerate(parsed_rows):
+                        if self._looks_like_csv_header(row):
+                            skip_rows = line_numbers[i]
+                            break
+                    else:
+                        # Fallback: use field count analysis
+                        field_counts = [len(row) for row in parsed_rows]
+                        from collections import Counter
+
+                        count_frequency = Counter(field_counts)
+                        most_common_count = count_frequency.most_common(1)[0][0]
+
+                        # Find first row that matches the most common field count
+                        for i, count in enumerate(field_counts):
+                            if count == most_common_count:
                                 skip_rows = line_numbers[i]
                                 break
-                        else:
-                            # Fallback: use field count analysis
-                            field_counts = [len(row) for row in parsed_rows]
-                            from collections import Counter
-
-                            count_frequency = Counter(field_counts)
-                            most_common_count = count_frequency.most_common(1)[0][0]
-
-                            # Find first row that matches the most common field count
-                            for i, count in enumerate(field_counts):
-                                if count == most_common_count:
-                                    skip_rows = line_numbers[i]
-                                    break
-
-                # Validate skip_rows doesn't exceed available lines
-                if skip_rows >= total_lines:
-                    skip_rows = 0  # Reset to safe default
 
-                # Now detect dialect from the CSV content (after skip_rows)
-                file.seek(0)
-                for _ in range(skip_rows):
-                    file.readline()
+            # Validate skip_rows doesn't exceed available lines
+            if skip_rows >= total_lines:
+                skip_rows = 0  # Reset to safe default
 
-                sample = file.read(65536)
-                dialect = Sniffer().sniff(sample)
+            # Now detect dialect from the buffered CSV content (after skip_rows)
+            sample = buffer.split("\n", skip_rows)[-1] if skip_rows else buffer
+            dialect = Sniffer().sniff(sample)
 
         except Exception:
             # If anything fails, use defaults and try basic dialect detection
             skip_rows = 0
             try:
-                with open(input_path, "r", encoding="utf8") as file:
-                    sample = file.read(65536)
-                    dialect = Sniffer().sniff(sample)
+                if buffer is None:
+                    buffer = self._read_sniff_buffer(input_path)
+                dialect = Sniffer().sniff(buffer)
             except Exception:
                 # Create a default dialect if everything fails
                 class DefaultDialect:
@@ -96,6 +126,12 @@ class CSVImporter(Importer["CsvImportSession"]):
 
         return skip_rows, dialect
 
+    @staticmethod
+    def _read_sniff_buffer(input_path: str, limit: int = SNIFF_LIMIT) -> str:
+        """Read the head of the file once; all detection works off this buffer."""
+        with open(input_path, "r", encoding="utf8") as file:
+            return file.read(limit)
+
     def _looks_like_csv_header(self, row: list[str]) -> bool:
         """Check if a row looks like a CSV header with column names."""
         if not row or len(row) < 2:
@@ -113,30 +149,11 @@ class CSVImporter(Importer["CsvImportSession"]):
             field = field.lower().strip()
 
             # Common column name patterns
-            if any(
-                word in field
-                for word in [
-                    "id",
-                    "name",
-                    "date",
-                    "time",
-                    "user",
-                    "tweet",
-                    "text",
-                    "count",
-                    "number",
-                    "sent",
-                    "screen",
-                    "retweeted",
-                    "favorited",
-                ]
-            ):
+            if HEADER_WORD_PATTERN.search(field):
                 header_indicators += 1
 
             # Short descriptive column names (not long sentences like CSV notes)
-            if 3 <= len(field) <= 30 and not field.startswith(
-                ("http", "www", "from ", "if you")
-            ):
+            if 3 <= len(field) <= 30 and not field.startswith(NOTE_PREFIXES):
                 header_indicators += 1
 
         # Consider it a CSV header if at least 50% of non-empty fields look like column names
@@ -371,7 +388,8 @@ class CsvImportSession(ImporterSession, BaseModel):
         smart_print_data_frame(config_data, title=None, apply_color=None)
 
     def load_preview(self, n_records: int) -> pl.DataFrame:
-        return pl.read_csv(
+        # Scan lazily so the row limit is pushed down into the CSV reader
+        return pl.scan_csv(
             self.input_file,
             separator=self.separator,
             quote_char=self.quote_char,
@@ -380,7 +398,7 @@ class CsvImportSession(ImporterSession, BaseModel):
             n_rows=n_records,
             truncate_ragged_lines=True,
             ignore_errors=True,
-        )
+        ).collect()
 
     def import_as_parquet(self, output_path: str) -> None:
         lazyframe = pl.scan_csv(
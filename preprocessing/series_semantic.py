@@ -1,19 +1,35 @@
+import warnings
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Callable, Type, Union
+from typing import Callable, Optional, Type, Union
 
 import polars as pl
-from pydantic import BaseModel
 
 from analyzer_interface import DataType
 
 
-class SeriesSemantic(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SeriesSemantic:
     semantic_name: str
     column_type: Union[Type[pl.DataType], Callable[[pl.DataType], bool]]
     prevalidate: Callable[[pl.Series], bool] = lambda s: True
     try_convert: Callable[[pl.Series], pl.Series]
+    sample_convert: Optional[Callable[[pl.Series], pl.Series]] = None
+    """Conversion used by `check` on the sample; defaults to `try_convert`."""
     validate_result: Callable[[pl.Series], pl.Series] = lambda s: s.is_not_null()
     data_type: DataType
+    _type_check: Callable[[pl.DataType], bool] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # Resolve the kind of type matcher once instead of on every check
+        column_type = self.column_type
+        if isinstance(column_type, type):
+            type_check = lambda dtype: isinstance(dtype, column_type)
+        else:
+            type_check = column_type
+        object.__setattr__(self, "_type_check", type_check)
 
     def check(self, series: pl.Series, threshold: float = 0.8, sample_size: int = 100):
         if not self.check_type(series):
@@ -23,15 +39,13 @@ class SeriesSemantic(BaseModel):
         try:
             if not self.prevalidate(sample):
                 return False
-            result = self.try_convert(sample)
+            result = (self.sample_convert or self.try_convert)(sample)
         except Exception:
             return False
         return self.validate_result(result).sum() / sample.len() > threshold
 
     def check_type(self, series: pl.Series):
-        if isinstance(self.column_type, type):
-            return isinstance(series.dtype, self.column_type)
-        return self.column_type(series.dtype)
+        return self._type_check(series.dtype)
 
 
 def parse_time_military(s: pl.Series) -> pl.Series:
@@ -39,6 +53,18 @@ def parse_time_military(s: pl.Series) -> pl.Series:
     # Try different time formats
     FORMATS_TO_TRY = ["%H:%M:%S", "%H:%M", "%I:%M:%S %p", "%I:%M %p"]
 
+    # Detect the format from the first non-null value so that the whole
+    # series only needs to be parsed once
+    first_value = s.drop_nulls().head(1)
+    for fmt in FORMATS_TO_TRY:
+        try:
+            probe = first_value.str.strptime(pl.Time, format=fmt, strict=False)
+            if probe.is_not_null().any():
+                return s.str.strptime(pl.Time, format=fmt, strict=False)
+        except:
+            continue
+
+    # Otherwise fall back to the first format that parses anything
     for fmt in FORMATS_TO_TRY:
         try:
             result = s.str.strptime(pl.Time, format=fmt, strict=False)
@@ -51,43 +77,46 @@ def parse_time_military(s: pl.Series) -> pl.Series:
     return pl.Series([None] * s.len(), dtype=pl.Time)
 
 
-def parse_datetime_with_tz(s: pl.Series) -> pl.Series:
-    """Parse datetime strings with timezone info (both abbreviations and offsets)"""
-    import warnings
+def parse_datetime_with_tz(s: pl.Series, *, warn_on_mixed: bool = True) -> pl.Series:
+    """Parse datetime strings with timezone info (both abbreviations and offsets)
 
+    Pass `warn_on_mixed=False` to skip the scan for multiple timezones, e.g. when
+    only probing a sample of the column.
+    """
     # Handle timezone abbreviations like "UTC", "EST"
     tz_abbrev_regex = r" ([A-Z]{3,4})$"  # UTC, EST, etc.
 
     # Handle timezone offsets like "-05:00", "+00:00"
     tz_offset_regex = r"[+-]\d{2}:\d{2}$"  # -05:00, +00:00, etc.
 
-    # Check for multiple different timezones
-    abbrev_matches = s.str.extract_all(tz_abbrev_regex)
-    offset_matches = s.str.extract_all(tz_offset_regex)
-
-    # Get unique timezone abbreviations
-    unique_abbrevs = set()
-    if not abbrev_matches.is_empty():
-        for match_list in abbrev_matches.to_list():
-            if match_list:  # Not empty
-                unique_abbrevs.update(match_list)
-
-    # Get unique timezone offsets
-    unique_offsets = set()
-    if not offset_matches.is_empty():
-        for match_list in offset_matches.to_list():
-            if match_list:  # Not empty
-                unique_offsets.update(match_list)
-
-    # Warn if multiple different timezones found
-    total_unique_tz = len(unique_abbrevs) + len(unique_offsets)
-    if total_unique_tz > 1:
-        all_tz = list(unique_abbrevs) + list(unique_offsets)
-        warnings.warn(
-            f"Multiple timezones found in datetime column: {all_tz}. "
-            f"Assuming all timestamps represent the same timezone for analysis purposes.",
-            UserWarning,
-        )
+    if warn_on_mixed:
+        # Check for multiple different timezones
+        abbrev_matches = s.str.extract_all(tz_abbrev_regex)
+        offset_matches = s.str.extract_all(tz_offset_regex)
+
+        # Get unique timezone abbreviations
+        unique_abbrevs = set()
+        if not abbrev_matches.is_empty():
+            for match_list in abbrev_matches.to_list():
+                if match_list:  # Not empty
+                    unique_abbrevs.update(match_list)
+
+        # Get unique timezone offsets
+        unique_offsets = set()
+        if not offset_matches.is_empty():
+            for match_list in offset_matches.to_list():
+                if match_list:  # Not empty
+                    unique_offsets.update(match_list)
+
+        # Warn if multiple different timezones found
+        total_unique_tz = len(unique_abbrevs) + len(unique_offsets)
+        if total_unique_tz > 1:
+            all_tz = list(unique_abbrevs) + list(unique_offsets)
+            warnings.warn(
+                f"Multiple timezones found in datetime column: {all_tz}. "
+                f"Assuming all timestamps represent the same timezone for analysis purposes.",
+                UserWarning,
+            )
 
     # Try to remove timezone abbreviations first
     result = s.str.replace(tz_abbrev_regex, "")
@@ -126,6 +155,8 @@ datetime_string = SeriesSemantic(
     semantic_name="datetime",
     column_type=pl.String,
     try_convert=parse_datetime_with_tz,
+    # The mixed-timezone warning is only meaningful for the full column
+    sample_convert=lambda s: parse_datetime_with_tz(s, warn_on_mixed=False),
     validate_result=lambda s: s.is_not_null(),
     data_type="datetime",
 )
@@ -166,7 +197,7 @@ url = SeriesSemantic(
     semantic_name="url",
     column_type=pl.String,
     try_convert=lambda s: s.str.strip_chars(),
-    validate_result=lambda s: s.str.count_matches("^https?://").gt(0),
+    validate_result=lambda s: s.str.contains("^https?://"),
     data_type="url",
 )
 
@@ -174,7 +205,7 @@ identifier = SeriesSemantic(
     semantic_name="identifier",
     column_type=pl.String,
     try_convert=lambda s: s.str.strip_chars(),
-    validate_result=lambda s: s.str.count_matches(r"^@?[A-Za-z0-9_.:-]+$").eq(1),
+    validate_result=lambda s: s.str.contains(r"^@?[A-Za-z0-9_.:-]+$"),
     data_type="identifier",
 )
 
@@ -228,11 +259,17 @@ all_semantics = [
 ]
 
 
+# Bound `check` methods paired with their semantic, in priority order
+_SEMANTIC_CHECKERS: tuple[tuple[Callable[..., bool], SeriesSemantic], ...] = tuple(
+    (semantic.check, semantic) for semantic in all_semantics
+)
+
+
 def infer_series_semantic(
     series: pl.Series, *, threshold: float = 0.8, sample_size=100
 ):
-    for semantic in all_semantics:
-        if semantic.check(series, threshold=threshold, sample_size=sample_size):
+    for check, semantic in _SEMANTIC_CHECKERS:
+        if check(series, threshold=threshold, sample_size=sample_size):
             return semantic
     return None
 
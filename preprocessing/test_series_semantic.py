@@ -202,6 +202,24 @@ def test_parse_datetime_mixed_timezones_warning():
     assert result.is_not_null().all()
 
 
+def test_datetime_check_does_not_warn_on_mixed_timezones():
+    """Test that probing a sample skips the mixed timezone warning"""
+    import warnings
+
+    series = pl.Series(
+        [
+            "2025-01-27 00:07:12 UTC",
+            "2025-01-27 00:07:16-05:00",
+            "2025-01-27 00:07:20 EST",
+        ]
+    )
+
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        assert datetime_string.check(series)
+        assert len(w) == 0
+
+
 def test_time_military_semantic_inference():
     """Test that time_military semantic gets properly detected"""
     # Test 24-hour format detection
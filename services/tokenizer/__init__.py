@@ -5,8 +5,7 @@ This service provides tokenization capabilities for social media analytics,
 with support for multilingual content and entity preservation.
 """
 
-# Basic implementation
-from .basic import BasicTokenizer, create_basic_tokenizer, tokenize_text
+from typing import TYPE_CHECKING
 
 # Core interfaces and types
 from .core import (
@@ -18,6 +17,21 @@ from .core import (
     TokenType,
 )
 
+if TYPE_CHECKING:
+    from .basic import BasicTokenizer, create_basic_tokenizer, tokenize_text
+
+# The basic implementation (and its regex patterns) is only imported on first use
+_BASIC_EXPORTS = {"BasicTokenizer", "create_basic_tokenizer", "tokenize_text"}
+
+
+def __getattr__(name: str):
+    if name in _BASIC_EXPORTS:
+        from . import basic
+
+        return getattr(basic, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Main exports
 __all__ = [
     # Core interfaces
@@ -7,8 +7,11 @@ regex and re modules.
 """
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, List
 
+from ..core.types import TokenizerConfig
+
 # Try to use the more powerful regex module, fall back to re
 try:
     import regex
@@ -19,19 +22,58 @@ except ImportError:
     REGEX_MODULE = re
     REGEX_AVAILABLE = False
 
+# Last-resort pattern used when a pattern fails to compile with both modules
+_FALLBACK_PATTERN = re.compile(r"\S+")
+
+
+def _safe_compile(pattern: str, fallback: Any = _FALLBACK_PATTERN) -> Any:
+    """
+    Compile a pattern, falling back from regex to re.
+
+    Patterns are compiled without IGNORECASE: the character classes already
+    list both cases, and the few literals that must match in any case (URL
+    schemes, ordinal suffixes) use scoped ``(?i:...)`` groups instead. This
+    keeps the engine from case-folding every character it scans.
+
+    Args:
+        pattern: Pattern source to compile
+        fallback: Value returned if the pattern fails to compile with both modules
+
+    Returns:
+        Compiled regex pattern, or ``fallback``
+    """
+    try:
+        return REGEX_MODULE.compile(pattern)
+    except Exception:
+        if REGEX_AVAILABLE:
+            try:
+                return re.compile(pattern)
+            except Exception:
+                pass
+        return fallback
+
 
 # Pattern constants
+# ASCII letters plus the letters that case-fold onto them (dotted I, dotless
+# i, long s, Kelvin sign); the patterns are compiled without IGNORECASE, so
+# these are listed explicitly to keep matching them as Latin letters
+LATIN_LETTERS = r"a-zA-Z\u0130\u0131\u017f\u212a"
+
 # URL patterns (comprehensive)
 URL_PATTERN = (
     r"(?:"
-    r"https?://\S+|"  # http/https URLs
-    r"www\.\S+|"  # www URLs
-    r"[a-zA-Z0-9](?:[a-zA-Z0-9-]*[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]*[a-zA-Z0-9])?)*\.[a-zA-Z]{2,}(?:/\S*)?"  # domain.ext patterns
+    r"(?i:https?://)\S+|"  # http/https URLs
+    r"(?i:www\.)\S+|"  # www URLs
+    rf"[{LATIN_LETTERS}0-9](?:[{LATIN_LETTERS}0-9-]*[{LATIN_LETTERS}0-9])?"  # domain
+    rf"(?:\.[{LATIN_LETTERS}0-9](?:[{LATIN_LETTERS}0-9-]*[{LATIN_LETTERS}0-9])?)*"
+    rf"\.[{LATIN_LETTERS}]{{2,}}(?:/\S*)?"  # .ext and optional path
     r")"
 )
 
 # Email patterns
-EMAIL_PATTERN = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
+EMAIL_PATTERN = (
+    rf"\b[{LATIN_LETTERS}0-9._%+-]+@[{LATIN_LETTERS}0-9.-]+\.[{LATIN_LETTERS}|]{{2,}}\b"
+)
 
 # Social media mentions and hashtags (support Unicode including Korean, Arabic, etc.)
 MENTION_PATTERN = r"@[\w]+"
@@ -40,7 +82,7 @@ HASHTAG_PATTERN = r"#[\w]+"
 # Numeric patterns (including decimals, percentages, etc.)
 NUMERIC_PATTERN = (
     r"(?:"
-    r"\d+(?:st|nd|rd|th)(?!\w)|"  # Ordinals with word boundary (6th, 21st)
+    r"\d+(?i:st|nd|rd|th)(?!\w)|"  # Ordinals with word boundary (6th, 21st)
     r"[$€£¥₹₽¥¢]\d+(?:[.,]\d+)*|"  # Currency with multiple separators
     r"\d+(?:[.,]\d+)+|"  # Numbers with one or more separator groups (200,000)
     r"\d+\.?\d*%?"  # Basic numbers with optional decimals/percentages
@@ -48,66 +90,67 @@ NUMERIC_PATTERN = (
 )
 
 # Cashtag pattern (stock tickers like $AAPL, $SPY)
-CASHTAG_PATTERN = r"\$[A-Z]{1,5}\b"
+CASHTAG_PATTERN = rf"\$[{LATIN_LETTERS}]{{1,5}}\b"
 
-# Emoji pattern (basic Unicode ranges)
+# Emoji pattern (basic Unicode ranges, as a single character class)
 EMOJI_PATTERN = (
-    r"(?:"
-    r"[\U0001F600-\U0001F64F]|"  # Emoticons
-    r"[\U0001F300-\U0001F5FF]|"  # Misc Symbols
-    r"[\U0001F680-\U0001F6FF]|"  # Transport
-    r"[\U0001F1E0-\U0001F1FF]|"  # Flags
-    r"[\U00002700-\U000027BF]|"  # Dingbats
-    r"[\U0001F900-\U0001F9FF]|"  # Supplemental Symbols
-    r"[\U00002600-\U000026FF]"  # Misc symbols
-    r")"
+    r"["
+    r"\U0001F600-\U0001F64F"  # Emoticons
+    r"\U0001F300-\U0001F5FF"  # Misc Symbols
+    r"\U0001F680-\U0001F6FF"  # Transport
+    r"\U0001F1E0-\U0001F1FF"  # Flags
+    r"\U00002700-\U000027BF"  # Dingbats
+    r"\U0001F900-\U0001F9FF"  # Supplemental Symbols
+    r"\U00002600-\U000026FF"  # Misc symbols
+    r"]"
 )
 
 # CJK character pattern
 CJK_PATTERN = (
-    r"(?:"
-    r"[\u4e00-\u9fff]|"  # CJK Unified Ideographs
-    r"[\u3400-\u4dbf]|"  # CJK Extension A
-    r"[\u3040-\u309f]|"  # Hiragana
-    r"[\u30a0-\u30ff]|"  # Katakana
-    r"[\uac00-\ud7af]"  # Hangul Syllables
-    r")"
+    r"["
+    r"\u4e00-\u9fff"  # CJK Unified Ideographs
+    r"\u3400-\u4dbf"  # CJK Extension A
+    r"\u3040-\u309f"  # Hiragana
+    r"\u30a0-\u30ff"  # Katakana
+    r"\uac00-\ud7af"  # Hangul Syllables
+    r"]"
 )
 
 # Arabic script pattern
 ARABIC_PATTERN = (
-    r"(?:"
-    r"[\u0600-\u06ff]|"  # Arabic
-    r"[\u0750-\u077f]|"  # Arabic Supplement
-    r"[\u08a0-\u08ff]"  # Arabic Extended-A
-    r")"
+    r"["
+    r"\u0600-\u06ff"  # Arabic
+    r"\u0750-\u077f"  # Arabic Supplement
+    r"\u08a0-\u08ff"  # Arabic Extended-A
+    r"]"
 )
 
 # Thai script pattern
-THAI_PATTERN = (
-    r"(?:"
-    r"[\u0e00-\u0e7f]"  # Thai script range
-    r")"
-)
+THAI_PATTERN = r"[\u0e00-\u0e7f]"  # Thai script range
 
 # Other Southeast Asian scripts (common in social media)
 SEA_PATTERN = (
-    r"(?:"
-    r"[\u1780-\u17ff]|"  # Khmer
-    r"[\u1000-\u109f]|"  # Myanmar
-    r"[\u1a00-\u1a1f]|"  # Buginese
-    r"[\u1b00-\u1b7f]"  # Balinese
-    r")"
+    r"["
+    r"\u1780-\u17ff"  # Khmer
+    r"\u1000-\u109f"  # Myanmar
+    r"\u1a00-\u1a1f"  # Buginese
+    r"\u1b00-\u1b7f"  # Balinese
+    r"]"
 )
 
 # Word patterns for different script types
 
-LATIN_WORD_PATTERN = r"[a-zA-Z]+(?:\.[a-zA-Z]+)+\.?|[a-zA-Z]+(?:[-'\u2019\u0060][a-zA-Z]+)*[-'\u2019\u0060]?"  # Handle abbreviations, contractions, and possessives
+# Handle abbreviations, contractions, and possessives
+LATIN_WORD_PATTERN = (
+    rf"[{LATIN_LETTERS}]+(?:\.[{LATIN_LETTERS}]+)+\.?|"
+    rf"[{LATIN_LETTERS}]+(?:[-'\u2019\u0060][{LATIN_LETTERS}]+)*[-'\u2019\u0060]?"
+)
 
 # Korean Hangul (space-separated, NOT character-level like Chinese/Japanese)
 KOREAN_WORD_PATTERN = r"[\uac00-\ud7af]+"
 
-WORD_PATTERN = f"(?:{LATIN_WORD_PATTERN}|{KOREAN_WORD_PATTERN}|{CJK_PATTERN}+|{ARABIC_PATTERN}+|{THAI_PATTERN}+|{SEA_PATTERN}+)"
+# CJK and Thai are tokenized per character, so they match one character at a time
+WORD_PATTERN = f"(?:{LATIN_WORD_PATTERN}|{KOREAN_WORD_PATTERN}|{CJK_PATTERN}|{ARABIC_PATTERN}+|{THAI_PATTERN}|{SEA_PATTERN}+)"
 
 # Punctuation (preserve some, group others)
 PUNCTUATION_PATTERN = r'[.!?;:,\-\(\)\[\]{}"\']'
@@ -138,6 +181,17 @@ COMBINED_SOCIAL_ENTITIES_PATTERN = (
 )
 
 
+# Bits of the configuration flags that select the comprehensive/exclusion patterns
+FLAG_URLS = 1 << 0
+FLAG_EMAILS = 1 << 1
+FLAG_MENTIONS = 1 << 2
+FLAG_HASHTAGS = 1 << 3
+FLAG_CASHTAGS = 1 << 4
+FLAG_EMOJI = 1 << 5
+FLAG_NUMERIC = 1 << 6
+FLAG_PUNCTUATION = 1 << 7
+
+
 class TokenizerPatterns:
     """
     Compiled regex patterns for tokenization.
@@ -147,9 +201,16 @@ class TokenizerPatterns:
     """
 
     def __init__(self):
-        """Initialize and compile all tokenization patterns."""
+        """Initialize tokenization patterns."""
         self._patterns: Dict[str, Any] = {}
-        self._compile_patterns()
+        self._register_patterns()
+
+        # Build the patterns for the default configuration up front so the
+        # first tokenize call with default settings doesn't pay for compilation
+        default_config = TokenizerConfig()
+        self.get_comprehensive_pattern(default_config)
+        self.get_ascii_pattern(default_config)
+        self.get_exclusion_pattern(default_config)
 
     def get_pattern(self, pattern_name: str) -> Any:
         """
@@ -165,7 +226,12 @@ class TokenizerPatterns:
             KeyError: If pattern name is not found
         """
         if pattern_name not in self._patterns:
-            raise KeyError(f"Pattern '{pattern_name}' not found")
+            if pattern_name not in self._pattern_sources:
+                raise KeyError(f"Pattern '{pattern_name}' not found")
+            # Individual patterns are compiled on first use
+            self._patterns[pattern_name] = _safe_compile(
+                self._pattern_sources[pattern_name]
+            )
         return self._patterns[pattern_name]
 
     def get_comprehensive_pattern(self, config) -> Any:
@@ -183,66 +249,25 @@ class TokenizerPatterns:
         Returns:
             Compiled regex pattern that matches all desired token types in priority order
         """
-        # Check cache first
-        cache_key = hash(frozenset(config.model_dump().items()))
-        if cache_key in _comprehensive_pattern_cache:
-            return _comprehensive_pattern_cache[cache_key]
-
-        pattern_parts = []
-
-        # Conditionally add URL and email patterns based on configuration
-        # This eliminates the need for post-processing filtering
-        if config.include_urls:
-            pattern_parts.append(self.get_pattern("url").pattern)
-
-        if config.include_emails:
-            pattern_parts.append(self.get_pattern("email").pattern)
-
-        if config.extract_mentions:
-            pattern_parts.append(self.get_pattern("mention").pattern)
-
-        if config.extract_hashtags:
-            pattern_parts.append(self.get_pattern("hashtag").pattern)
-
-        # Cashtag pattern BEFORE numeric pattern (priority matters)
-        if config.extract_cashtags:
-            pattern_parts.append(self.get_pattern("cashtag").pattern)
-
-        if config.include_emoji:
-            pattern_parts.append(self.get_pattern("emoji").pattern)
-
-        if config.include_numeric:
-            pattern_parts.append(self.get_pattern("numeric").pattern)
-
-        # Always include word pattern (this is the core tokenization)
-        pattern_parts.append(self.get_pattern("word").pattern)
+        return _build_comprehensive_pattern(_config_flag_bits(config))
 
-        if config.include_punctuation:
-            pattern_parts.append(self.get_pattern("punctuation").pattern)
+    def get_ascii_pattern(self, config) -> Any:
+        """
+        Build the comprehensive pattern for text that is pure ASCII.
 
-        # Don't add the greedy fallback - let configuration control what gets captured
+        Only the alternatives that can match ASCII characters are kept (no
+        emoji or non-Latin scripts), and the pattern is compiled with the
+        stdlib engine in ASCII mode, which scans ASCII text markedly faster
+        than the Unicode-aware engine. On ASCII input it finds exactly the
+        tokens the comprehensive pattern does.
 
-        # Combine patterns with alternation (| operator)
-        comprehensive_pattern = "(?:" + "|".join(pattern_parts) + ")"
+        Args:
+            config: TokenizerConfig specifying which token types to include
 
-        try:
-            compiled_pattern = REGEX_MODULE.compile(
-                comprehensive_pattern, REGEX_MODULE.IGNORECASE
-            )
-        except Exception:
-            # Fallback to standard re module
-            if REGEX_AVAILABLE and REGEX_MODULE is not re:
-                try:
-                    compiled_pattern = re.compile(comprehensive_pattern, re.IGNORECASE)
-                except Exception:
-                    # Ultimate fallback - just match words
-                    compiled_pattern = re.compile(r"\S+", re.IGNORECASE)
-            else:
-                compiled_pattern = re.compile(r"\S+", re.IGNORECASE)
-
-        # Store in cache
-        _comprehensive_pattern_cache[cache_key] = compiled_pattern
-        return compiled_pattern
+        Returns:
+            Compiled regex pattern for ASCII-only text
+        """
+        return _build_ascii_pattern(_config_flag_bits(config))
 
     def get_exclusion_pattern(self, config) -> Any:
         """
@@ -258,55 +283,21 @@ class TokenizerPatterns:
         Returns:
             Compiled regex pattern that matches excluded entities, or None if no exclusions
         """
-        # Check cache first
-        cache_key = hash(frozenset(config.model_dump().items()))
-        if cache_key in _exclusion_pattern_cache:
-            return _exclusion_pattern_cache[cache_key]
-
-        exclusion_parts = []
-
-        if not config.include_urls:
-            exclusion_parts.append(self.get_pattern("url").pattern)
-
-        if not config.include_emails:
-            exclusion_parts.append(self.get_pattern("email").pattern)
-
-        if not config.include_numeric:
-            exclusion_parts.append(self.get_pattern("numeric").pattern)
-
-        if not exclusion_parts:
-            # Cache None result
-            _exclusion_pattern_cache[cache_key] = None
-            return None
-
-        # Combine exclusion patterns
-        exclusion_pattern = "(?:" + "|".join(exclusion_parts) + ")"
-
-        try:
-            result = REGEX_MODULE.compile(exclusion_pattern, REGEX_MODULE.IGNORECASE)
-        except Exception:
-            # Fallback to standard re module
-            if REGEX_AVAILABLE and REGEX_MODULE is not re:
-                try:
-                    result = re.compile(exclusion_pattern, re.IGNORECASE)
-                except Exception:
-                    result = None
-            else:
-                result = None
-
-        # Store in cache
-        _exclusion_pattern_cache[cache_key] = result
-        return result
+        return _build_exclusion_pattern(_config_flag_bits(config))
 
     def list_patterns(self) -> List[str]:
         """Get list of available pattern names."""
-        return list(self._patterns.keys())
+        return list(self._pattern_sources.keys())
 
-    def _compile_patterns(self):
-        """Compile all regex patterns with fallback support."""
+    def _register_patterns(self):
+        """
+        Register the source of every named pattern.
 
-        # Compile patterns with fallback handling
-        patterns_to_compile = {
+        The comprehensive and exclusion patterns are built from the module
+        pattern constants directly, so individual patterns are only compiled
+        when requested through get_pattern.
+        """
+        self._pattern_sources: Dict[str, str] = {
             "url": URL_PATTERN,
             "email": EMAIL_PATTERN,
             "mention": MENTION_PATTERN,
@@ -324,31 +315,121 @@ class TokenizerPatterns:
             "combined_social_entities": COMBINED_SOCIAL_ENTITIES_PATTERN,
         }
 
-        for name, pattern in patterns_to_compile.items():
-            try:
-                self._patterns[name] = REGEX_MODULE.compile(
-                    pattern, REGEX_MODULE.IGNORECASE
-                )
-            except Exception:
-                # If compilation fails with regex module, fall back to re
-                if REGEX_AVAILABLE and REGEX_MODULE is not re:
-                    try:
-                        self._patterns[name] = re.compile(pattern, re.IGNORECASE)
-                    except Exception:
-                        # If both fail, create a simple fallback
-                        self._patterns[name] = re.compile(r"\S+", re.IGNORECASE)
-                else:
-                    # Already using re module, create simple fallback
-                    self._patterns[name] = re.compile(r"\S+", re.IGNORECASE)
+
+def _config_flag_bits(config) -> int:
+    """
+    Encode the configuration flags that affect pattern building as a small int.
+
+    Only these flags change the comprehensive and exclusion patterns, so this
+    is a much cheaper cache key than hashing the full model dump.
+    """
+    return (
+        config.include_urls * FLAG_URLS
+        | config.include_emails * FLAG_EMAILS
+        | config.extract_mentions * FLAG_MENTIONS
+        | config.extract_hashtags * FLAG_HASHTAGS
+        | config.extract_cashtags * FLAG_CASHTAGS
+        | config.include_emoji * FLAG_EMOJI
+        | config.include_numeric * FLAG_NUMERIC
+        | config.include_punctuation * FLAG_PUNCTUATION
+    )
+
+
+# One entry per combination of the eight configuration flag bits
+@lru_cache(maxsize=256)
+def _build_comprehensive_pattern(flag_bits: int) -> Any:
+    """Compile the comprehensive pattern for the given configuration flag bits."""
+    return _safe_compile(_comprehensive_source(flag_bits, ascii_only=False))
+
+
+@lru_cache(maxsize=256)
+def _build_ascii_pattern(flag_bits: int) -> Any:
+    """Compile the ASCII-only pattern for the given configuration flag bits."""
+    try:
+        return re.compile(_comprehensive_source(flag_bits, ascii_only=True), re.ASCII)
+    except re.error:
+        # The full pattern gives the same tokens, just more slowly
+        return _build_comprehensive_pattern(flag_bits)
+
+
+def _comprehensive_source(flag_bits: int, ascii_only: bool) -> str:
+    """
+    Assemble the comprehensive pattern source for the given flag bits.
+
+    Args:
+        flag_bits: Configuration flag bits from _config_flag_bits
+        ascii_only: Leave out alternatives that can't match ASCII text
+
+    Returns:
+        Pattern source with the enabled token types in priority order
+    """
+    pattern_parts = []
+
+    # Conditionally add URL and email patterns based on configuration
+    # This eliminates the need for post-processing filtering
+    if flag_bits & FLAG_URLS:
+        pattern_parts.append(URL_PATTERN)
+
+    if flag_bits & FLAG_EMAILS:
+        pattern_parts.append(EMAIL_PATTERN)
+
+    if flag_bits & FLAG_MENTIONS:
+        pattern_parts.append(MENTION_PATTERN)
+
+    if flag_bits & FLAG_HASHTAGS:
+        pattern_parts.append(HASHTAG_PATTERN)
+
+    # Cashtag pattern BEFORE numeric pattern (priority matters)
+    if flag_bits & FLAG_CASHTAGS:
+        pattern_parts.append(CASHTAG_PATTERN)
+
+    if flag_bits & FLAG_EMOJI and not ascii_only:
+        pattern_parts.append(EMOJI_PATTERN)
+
+    if flag_bits & FLAG_NUMERIC:
+        pattern_parts.append(NUMERIC_PATTERN)
+
+    # Always include word pattern (this is the core tokenization)
+    if ascii_only:
+        pattern_parts.append(LATIN_WORD_PATTERN)
+    else:
+        pattern_parts.append(WORD_PATTERN)
+
+    if flag_bits & FLAG_PUNCTUATION:
+        pattern_parts.append(PUNCTUATION_PATTERN)
+
+    # Don't add the greedy fallback - let configuration control what gets captured
+
+    # Combine patterns with alternation (| operator)
+    return "(?:" + "|".join(pattern_parts) + ")"
+
+
+@lru_cache(maxsize=256)
+def _build_exclusion_pattern(flag_bits: int) -> Any:
+    """Compile the exclusion pattern for the given configuration flag bits."""
+    exclusion_parts = []
+
+    if not flag_bits & FLAG_URLS:
+        exclusion_parts.append(URL_PATTERN)
+
+    if not flag_bits & FLAG_EMAILS:
+        exclusion_parts.append(EMAIL_PATTERN)
+
+    if not flag_bits & FLAG_NUMERIC:
+        exclusion_parts.append(NUMERIC_PATTERN)
+
+    if not exclusion_parts:
+        return None
+
+    # Combine exclusion patterns
+    exclusion_pattern = "(?:" + "|".join(exclusion_parts) + ")"
+
+    return _safe_compile(exclusion_pattern, fallback=None)
 
 
 # Global instance for easy access
 _global_patterns = None
 
-# Separate module-level caches for pattern compilation
-_comprehensive_pattern_cache = {}
-_exclusion_pattern_cache = {}
-
 
 def get_patterns() -> TokenizerPatterns:
     """
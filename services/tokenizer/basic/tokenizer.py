@@ -6,12 +6,52 @@ Unicode-aware tokenization for social media text with entity preservation.
 """
 
 import re
+from bisect import bisect_right
 from typing import Optional
 
 from ..core.base import AbstractTokenizer
 from ..core.types import LanguageFamily, TokenizerConfig, TokenList
 from .patterns import get_patterns
 
+# Scripts tokenized one character at a time, as sorted code point intervals
+_CHAR_LEVEL_INTERVALS = (
+    (0x0E00, 0x0E7F),  # Thai
+    (0x0E80, 0x0EFF),  # Lao
+    (0x1000, 0x109F),  # Myanmar
+    (0x1780, 0x17FF),  # Khmer
+    (0x3040, 0x309F),  # Hiragana
+    (0x30A0, 0x30FF),  # Katakana
+    (0x3400, 0x4DBF),  # CJK Extension A
+    (0x4E00, 0x9FFF),  # CJK Unified Ideographs
+)
+
+# The intervals as a regex character class body (e.g. "\u0e00-\u0e7f...")
+_CHAR_LEVEL_RANGES = "".join(
+    f"\\u{start:04x}-\\u{end:04x}" for start, end in _CHAR_LEVEL_INTERVALS
+)
+
+# Interval bounds for single-character lookups without the regex engine
+_CHAR_LEVEL_STARTS, _CHAR_LEVEL_ENDS = zip(*_CHAR_LEVEL_INTERVALS)
+
+# Character-level script detection, compiled once at import
+_CHAR_LEVEL_PATTERN = re.compile(f"[{_CHAR_LEVEL_RANGES}]")
+
+# Tokens made only of character-level characters and whitespace
+_PURE_CHAR_LEVEL_PATTERN = re.compile(rf"[{_CHAR_LEVEL_RANGES}\s]*")
+
+# Splits a token into single character-level characters and runs of
+# everything else
+_CHAR_LEVEL_SPLIT_PATTERN = re.compile(
+    f"[{_CHAR_LEVEL_RANGES}]|[^{_CHAR_LEVEL_RANGES}]+"
+)
+
+# Abbreviations: letter(s).letter(s).letter(s) where segments are 1-3 chars
+# (e.g. "U.S.", "c.e.o.s")
+_ABBREVIATION_PATTERN = re.compile(r"^[a-z]{1,3}(?:\.[a-z]{1,3})+\.?$", re.IGNORECASE)
+
+# Text made only of ASCII letters and whitespace: every word is one token
+_PLAIN_WORDS_PATTERN = re.compile(r"[a-zA-Z \t\n\r\f\v]*")
+
 
 class BasicTokenizer(AbstractTokenizer):
     """
@@ -32,18 +72,6 @@ class BasicTokenizer(AbstractTokenizer):
         super().__init__(config)
         self._patterns = get_patterns()
 
-        # Compile regex pattern for character-level script detection (performance optimization)
-        self._CHAR_LEVEL_PATTERN = re.compile(
-            r"[\u4e00-\u9fff"  # CJK Unified Ideographs
-            r"\u3400-\u4dbf"  # CJK Extension A
-            r"\u3040-\u309f"  # Hiragana
-            r"\u30a0-\u30ff"  # Katakana
-            r"\u0e00-\u0e7f"  # Thai
-            r"\u0e80-\u0eff"  # Lao
-            r"\u1000-\u109f"  # Myanmar
-            r"\u1780-\u17ff]"  # Khmer
-        )
-
     def tokenize(self, text: str) -> TokenList:
         """
         Tokenize input text into a list of tokens.
@@ -86,7 +114,9 @@ class BasicTokenizer(AbstractTokenizer):
 
     def _is_char_level_script(self, char: str) -> bool:
         """Check if character belongs to a character-level script."""
-        return bool(self._CHAR_LEVEL_PATTERN.match(char))
+        code_point = ord(char)
+        index = bisect_right(_CHAR_LEVEL_STARTS, code_point) - 1
+        return index >= 0 and code_point <= _CHAR_LEVEL_ENDS[index]
 
     def _get_char_script(self, char: str) -> str:
         """
@@ -147,6 +177,11 @@ class BasicTokenizer(AbstractTokenizer):
         if not text.strip():
             return []
 
+        # Plain words contain nothing the entity patterns or script handling
+        # would act on, so splitting on whitespace gives the same tokens
+        if _PLAIN_WORDS_PATTERN.fullmatch(text):
+            return text.split()
+
         # Remove excluded entities (URLs/emails) from text if they are disabled
         # This prevents them from being tokenized into component words
         exclusion_pattern = self._patterns.get_exclusion_pattern(self._config)
@@ -160,8 +195,14 @@ class BasicTokenizer(AbstractTokenizer):
             return []
 
         # Get comprehensive pattern based on configuration
-        # This single pattern finds ALL tokens in document order
-        comprehensive_pattern = self._patterns.get_comprehensive_pattern(self._config)
+        # This single pattern finds ALL tokens in document order; ASCII text
+        # uses a faster variant that finds the same tokens
+        if text.isascii():
+            comprehensive_pattern = self._patterns.get_ascii_pattern(self._config)
+        else:
+            comprehensive_pattern = self._patterns.get_comprehensive_pattern(
+                self._config
+            )
 
         # Single regex call gets all tokens in order - this is the key optimization!
         raw_tokens = comprehensive_pattern.findall(text)
@@ -178,8 +219,14 @@ class BasicTokenizer(AbstractTokenizer):
             if not token.strip():
                 continue
 
-            # Clean URLs by removing trailing punctuation
-            if self._is_url_like(token):
+            # A single character has nothing to clean or split
+            if len(token) == 1:
+                tokens.append(token)
+                continue
+
+            # Clean URLs by removing trailing punctuation (a URL-like token
+            # always has a "." or "://", so other tokens skip the checks)
+            if ("." in token or ":" in token) and self._is_url_like(token):
                 token = self._clean_url_token(token)
 
             # For character-level scripts, break down multi-character tokens into individual characters
@@ -196,8 +243,11 @@ class BasicTokenizer(AbstractTokenizer):
                     tokens.append(token)
             elif language_family == LanguageFamily.MIXED:
                 # For mixed script, break down character-level script parts but keep Latin parts whole
-                processed_tokens = self._process_mixed_script_token(token)
-                tokens.extend(processed_tokens)
+                if token.isascii():
+                    # No character-level script parts to break down
+                    tokens.append(token)
+                else:
+                    tokens.extend(self._process_mixed_script_token(token))
             else:
                 tokens.append(token)
 
@@ -238,10 +288,7 @@ class BasicTokenizer(AbstractTokenizer):
             and "@" not in token
         ):
             # Check if this looks like an abbreviation (single letters between periods)
-            # Pattern: letter(s).letter(s).letter(s) where segments are 1-3 chars
-            abbreviation_pattern = r"^[a-z]{1,3}(?:\.[a-z]{1,3})+\.?$"
-
-            if re.match(abbreviation_pattern, token, re.IGNORECASE):
+            if _ABBREVIATION_PATTERN.match(token):
                 return False  # This is an abbreviation, not a URL
             # If it has a period and looks like a domain, it's URL-like
             return True
@@ -259,60 +306,35 @@ class BasicTokenizer(AbstractTokenizer):
 
     def _contains_char_level_chars(self, token: str) -> bool:
         """Check if token contains any character-level script characters."""
-        return any(self._is_char_level_script(char) for char in token)
+        # All character-level scripts are outside ASCII, so the common ASCII
+        # token can skip the per-character scan
+        if token.isascii():
+            return False
+        return _CHAR_LEVEL_PATTERN.search(token) is not None
 
     def _is_pure_char_level_token(self, token: str) -> bool:
         """Check if token contains only character-level script characters."""
-        return all(self._is_char_level_script(char) or char.isspace() for char in token)
+        return _PURE_CHAR_LEVEL_PATTERN.fullmatch(token) is not None
 
     def _process_mixed_script_token(self, token: str) -> TokenList:
         """Process mixed script tokens by breaking down character-level script parts."""
         if not self._contains_char_level_chars(token):
             return [token]
 
-        # Check if token mixes Latin with CJK
+        # The token is known to contain CJK, so check if it mixes in Latin
         has_latin = any(c.isascii() and c.isalpha() for c in token)
-        has_cjk = any(self._is_char_level_script(c) for c in token)
 
         # Don't apply mixed-script preservation to social media entities
         is_social_entity = token.startswith(("@", "#", "$"))
 
-        if has_latin and has_cjk and not is_social_entity:
+        if has_latin and not is_social_entity:
             # Mixed script - keep intact (brand names, bot tricks)
             return [token]
 
-        # Rest of existing logic for pure CJK tokens...
-        result = []
-        current_token = ""
-        current_is_cjk = None
-
-        for char in token:
-            char_is_cjk = self._is_char_level_script(char)
-
-            if current_is_cjk is None:
-                current_is_cjk = char_is_cjk
-                current_token = char
-            elif char_is_cjk == current_is_cjk:
-                current_token += char
-            else:
-                # Script change
-                if current_token.strip():
-                    if current_is_cjk and len(current_token) > 1:
-                        # Break CJK into individual characters
-                        result.extend(list(current_token))
-                    else:
-                        result.append(current_token)
-                current_token = char
-                current_is_cjk = char_is_cjk
-
-        # Handle final token
-        if current_token.strip():
-            if current_is_cjk and len(current_token) > 1:
-                result.extend(list(current_token))
-            else:
-                result.append(current_token)
-
-        return result
+        # Break CJK into individual characters, keeping other runs whole
+        return [
+            part for part in _CHAR_LEVEL_SPLIT_PATTERN.findall(token) if part.strip()
+        ]
 
     def _postprocess_tokens(self, tokens: TokenList) -> TokenList:
         """
@@ -6,6 +6,10 @@ Provides pre-configured tokenizer fixtures to reduce boilerplate:
 - social_media_tokenizer: Full social media extraction (includes emoji)
 - clean_text_tokenizer: No social entities, clean text only
 - preserve_case_tokenizer: Case-preserving tokenization
+- tokenizer_factory: Builds tokenizers from config kwargs, cached per module
+
+Tokenizers hold no per-call state, so each fixture builds a single instance
+per test module instead of one per test.
 
 Use fixtures in tests by adding them as function parameters:
     def test_my_feature(self, default_tokenizer):
@@ -15,24 +19,36 @@ Use fixtures in tests by adding them as function parameters:
 
 import pytest
 
-from services.tokenizer.basic import BasicTokenizer
 from services.tokenizer.core.types import CaseHandling, TokenizerConfig
 
+
+def _build_tokenizer(**config_kwargs):
+    """Build a BasicTokenizer from TokenizerConfig keyword arguments.
+
+    The basic implementation is imported here rather than at module level so
+    collecting tests that never build a tokenizer (e.g. the core type tests)
+    doesn't import it and its regex patterns.
+    """
+    from services.tokenizer.basic import BasicTokenizer
+
+    return BasicTokenizer(TokenizerConfig(**config_kwargs))
+
+
 # =============================================================================
 # Tokenizer Fixtures
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def default_tokenizer():
     """Basic tokenizer with default configuration."""
-    return BasicTokenizer()
+    return _build_tokenizer()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def social_media_tokenizer():
     """Tokenizer configured for social media analysis."""
-    config = TokenizerConfig(
+    return _build_tokenizer(
         extract_hashtags=True,
         extract_mentions=True,
         extract_cashtags=True,
@@ -41,10 +57,9 @@ def social_media_tokenizer():
         include_emoji=True,
         case_handling=CaseHandling.LOWERCASE,
     )
-    return BasicTokenizer(config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def clean_text_tokenizer():
     """Tokenizer configured for clean text (no social entities).
 
@@ -55,7 +70,7 @@ def clean_text_tokenizer():
             assert "user" in result
             assert "hashtag" in result
     """
-    config = TokenizerConfig(
+    return _build_tokenizer(
         extract_hashtags=False,
         extract_mentions=False,
         extract_cashtags=False,
@@ -65,10 +80,9 @@ def clean_text_tokenizer():
         include_punctuation=False,
         case_handling=CaseHandling.LOWERCASE,
     )
-    return BasicTokenizer(config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def preserve_case_tokenizer():
     """Tokenizer that preserves original case.
 
@@ -77,5 +91,27 @@ def preserve_case_tokenizer():
             result = preserve_case_tokenizer.tokenize("Hello World")
             assert result == ["Hello", "World"]
     """
-    config = TokenizerConfig(case_handling=CaseHandling.PRESERVE)
-    return BasicTokenizer(config)
+    return _build_tokenizer(case_handling=CaseHandling.PRESERVE)
+
+
+@pytest.fixture(scope="module")
+def tokenizer_factory():
+    """Build tokenizers from TokenizerConfig keyword arguments.
+
+    Tokenizers are cached by their config kwargs for the whole test module,
+    so tests sharing a configuration share one instance.
+
+    Example:
+        def test_my_feature(self, tokenizer_factory):
+            tokenizer = tokenizer_factory(include_numeric=False)
+            assert "123" not in tokenizer.tokenize("I have 123 apples")
+    """
+    cache = {}
+
+    def make(**config_kwargs):
+        key = tuple(sorted(config_kwargs.items()))
+        if key not in cache:
+            cache[key] = _build_tokenizer(**config_kwargs)
+        return cache[key]
+
+    return make
@@ -5,10 +5,31 @@ This module contains the abstract base class that defines
 the interface for all tokenizer implementations.
 """
 
+import unicodedata
 from abc import ABC, abstractmethod
-from typing import Optional
-
-from .types import TokenizerConfig, TokenList
+from typing import Iterable, Optional
+
+from .types import CaseHandling, TokenizerConfig, TokenList
+
+# Code points accepted in emoji tokens: emoji plus common modifiers
+_EMOJI_CODEPOINTS = frozenset(
+    cp
+    for first, last in (
+        (0x1F600, 0x1F64F),  # Emoticons
+        (0x1F300, 0x1F5FF),  # Misc Symbols & Pictographs
+        (0x1F680, 0x1F6FF),  # Transport & Map
+        (0x1F1E6, 0x1F1FF),  # Regional Indicators
+        (0x2600, 0x26FF),  # Misc symbols
+        (0x2700, 0x27BF),  # Dingbats
+        (0x1F900, 0x1F9FF),  # Supplemental Symbols & Pictographs
+        (0x1FA70, 0x1FAFF),  # Symbols & Pictographs Extended-A
+        (0x200D, 0x200D),  # ZWJ
+        (0xFE0E, 0xFE0F),  # VS15, VS16
+        (0x1F3FB, 0x1F3FF),  # Skin tone modifiers
+        (0xE0020, 0xE007F),  # Emoji tag sequences
+    )
+    for cp in range(first, last + 1)
+)
 
 
 class AbstractTokenizer(ABC):
@@ -49,6 +70,19 @@ class AbstractTokenizer(ABC):
         """
         pass
 
+    def tokenize_many(self, texts: Iterable[str]) -> list[TokenList]:
+        """
+        Tokenize a batch of texts with the same configuration.
+
+        Args:
+            texts: Input texts to tokenize
+
+        Returns:
+            One token list per input text, in input order
+        """
+        tokenize = self.tokenize
+        return [tokenize(text) for text in texts]
+
     def _preprocess_text(self, text: str) -> str:
         """
         Apply preprocessing to text before tokenization.
@@ -65,15 +99,11 @@ class AbstractTokenizer(ABC):
         if not text:
             return text
 
-        # Apply Unicode normalization
-        if self._config.normalize_unicode:
-            import unicodedata
-
+        # Apply Unicode normalization (ASCII text is already normalized)
+        if self._config.normalize_unicode and not text.isascii():
             text = unicodedata.normalize("NFKC", text)
 
-        # Apply case handling
-        from .types import CaseHandling
-
+        # Apply case handling to the whole text once, not per token
         if self._config.case_handling == CaseHandling.LOWERCASE:
             text = text.lower()
         elif self._config.case_handling == CaseHandling.UPPERCASE:
@@ -101,11 +131,19 @@ class AbstractTokenizer(ABC):
         if not tokens:
             return tokens
 
+        # Read the config once rather than per token
+        config = self._config
+        strip_whitespace = config.strip_whitespace
+        filter_emoji = not config.include_emoji
+        min_length = config.min_token_length
+        max_length = config.max_token_length
+        is_emoji = self._is_emoji
+
         processed_tokens = []
 
         for token in tokens:
             # Strip whitespace if configured
-            if self._config.strip_whitespace:
+            if strip_whitespace:
                 token = token.strip()
 
             # Skip empty tokens
@@ -113,17 +151,14 @@ class AbstractTokenizer(ABC):
                 continue
 
             # Filter emojis if not included
-            if not self._config.include_emoji and self._is_emoji(token):
+            if filter_emoji and is_emoji(token):
                 continue
 
             # Apply length filtering
-            if len(token) < self._config.min_token_length:
+            if len(token) < min_length:
                 continue
 
-            if (
-                self._config.max_token_length is not None
-                and len(token) > self._config.max_token_length
-            ):
+            if max_length is not None and len(token) > max_length:
                 continue
 
             processed_tokens.append(token)
@@ -144,36 +179,9 @@ class AbstractTokenizer(ABC):
         if not token:
             return False
 
-        # Accept sequences made of emoji code points plus common modifiers
-        EMOJI_RANGES = (
-            (0x1F600, 0x1F64F),  # Emoticons
-            (0x1F300, 0x1F5FF),  # Misc Symbols & Pictographs
-            (0x1F680, 0x1F6FF),  # Transport & Map
-            (0x1F1E6, 0x1F1FF),  # Regional Indicators
-            (0x2600, 0x26FF),  # Misc symbols
-            (0x2700, 0x27BF),  # Dingbats
-            (0x1F900, 0x1F9FF),  # Supplemental Symbols & Pictographs
-            (0x1FA70, 0x1FAFF),  # Symbols & Pictographs Extended-A
-        )
-        MODIFIERS = {0x200D, 0xFE0E, 0xFE0F}  # ZWJ, VS15, VS16
-        SKIN_TONE = (0x1F3FB, 0x1F3FF)
-        TAGS = (0xE0020, 0xE007F)  # Emoji tag sequences
-
-        def in_any_range(cp: int, ranges) -> bool:
-            for a, b in ranges:
-                if a <= cp <= b:
-                    return True
+        # Every emoji code point is far outside ASCII
+        if token.isascii():
             return False
 
-        def is_modifier(cp: int) -> bool:
-            return (
-                cp in MODIFIERS
-                or SKIN_TONE[0] <= cp <= SKIN_TONE[1]
-                or TAGS[0] <= cp <= TAGS[1]
-            )
-
-        for ch in token:
-            cp = ord(ch)
-            if not (in_any_range(cp, EMOJI_RANGES) or is_modifier(cp)):
-                return False
-        return True
+        # Accept sequences made of emoji code points plus common modifiers
+        return _EMOJI_CODEPOINTS.issuperset(map(ord, token))